@@ -5,6 +5,13 @@ Comprehensive test reporting for Python projects with HTML reports and chart vis
 
 from robo_automation_test_kit.utils import RoboHelper
 
-__version__ = RoboHelper.get_version()
-
 __all__ = ["RoboHelper"]
+
+
+def __getattr__(name):
+    # Defer the pyproject.toml read until __version__ is actually used
+    # (report header/title); plain package import stays metadata-free.
+    if name == "__version__":
+        globals()["__version__"] = RoboHelper.get_version()
+        return globals()["__version__"]
+    raise AttributeError(name)
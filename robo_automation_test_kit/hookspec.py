@@ -6,7 +6,7 @@ These hooks allow source projects to customize the reporting behavior.
 import pytest
 
 
-@pytest.hookspec
+@pytest.hookspec(firstresult=True)
 def robo_modify_report_row(report_row, test_data):
     """
     Hook specification for source projects to provide custom test data attributes.
@@ -32,5 +32,10 @@ def robo_modify_report_row(report_row, test_data):
                 'custom_field': test_data.get('Custom Field', ''),
                 'priority': test_data.get('Priority', 'Medium'),
             }
+
+    Note:
+        The implementation must carry the @pytest.hookimpl marker so pytest
+        registers it when the conftest module is loaded; the plugin calls it
+        through pluggy's cached dispatch (firstresult=True).
     """
     pass
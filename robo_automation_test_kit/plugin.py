@@ -37,19 +37,18 @@ CUSTOM HOOKS (Robo Reporter Extensions):
 - robo_modify_report_row        - Allow projects to provide custom test attributes
 """
 
+import functools
 import logging
 import os
+import re
 import shutil
+import threading
 import sys
 import tempfile
+import time
 from datetime import datetime
-from pathlib import Path
 
-from dotenv import load_dotenv
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
 
 from .utils.RoboHelper import (
     print_results_summary,
@@ -59,21 +58,204 @@ from .utils.RoboHelper import (
     flatten_results,
     aggregate_test_results,
 )
-from .utils import get_env, load_test_data
+from .utils import get_env, invalidate_env_cache, load_test_data
 
 
 logger = logging.getLogger(__name__)
 logger.propagate = True
 
-# Load environment variables from .env file
-load_dotenv()
+
+# ============================================================================
+# Stash keys for plugin state kept on the pytest Config object
+# ============================================================================
+# pytest.StashKey gives typed, collision-free storage on config.stash with
+# plain dict lookups, instead of setattr'ing ad-hoc attributes on Config
+# and probing them with hasattr. Defined here (not in RoboHelper) so that
+# importing the package without pytest installed keeps working.
+
+RESULTS_STASH_KEY = pytest.StashKey[list]()
+SESSION_START_STASH_KEY = pytest.StashKey[datetime]()
+SESSION_START_NS_STASH_KEY = pytest.StashKey[int]()
+SELECTED_TESTS_STASH_KEY = pytest.StashKey[frozenset]()
+SELECTED_PREFIXES_STASH_KEY = pytest.StashKey[tuple]()
+
+# Set once .env has been loaded; keeps repeat hook invocations (and
+# conftest imports) from re-statting and re-parsing the file
+_ENV_LOADED = False
+_PARALLEL_EXECUTION = None  # Cached PARALLEL_EXECUTION setting
+
+
+def _ensure_env_loaded():
+    """Load environment variables from .env exactly once per process."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        # Imported here so collection-only runs don't pay the import cost
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        # .env may have changed os.environ; drop any stale memoized values
+        invalidate_env_cache()
+        _ENV_LOADED = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_webdriver_classes():
+    """
+    Import Selenium lazily and return (webdriver, Options, WebDriverWait).
+
+    Selenium's import is one of the most expensive in the dependency tree;
+    deferring it to first fixture use keeps pytest startup (and runs that
+    never touch a browser, e.g. --collect-only) fast. The lru_cache makes
+    the import happen at most once per process.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    return webdriver, Options, WebDriverWait
 
 # ============================================================================
 # Global Variables for pytest-xdist result aggregation
 # ============================================================================
 
 _MASTER_CONFIG = None  # Global reference to master config for xdist aggregation
-_CONFTEST_HOOK_MODULE = None  # Cached conftest module with robo_modify_report_row
+
+# Dedicated pluggy manager for the robo_* hooks. pytest's own plugin
+# manager only collects hookimpls whose name starts with "pytest_", so the
+# robo_modify_report_row implementations in conftest files are registered
+# here instead; per-test calls then go through pluggy's cached dispatch
+# rather than a getattr + manual call.
+_ROBO_PM = None
+
+# Cached, validating adapter around the robo_modify_report_row hookcaller,
+# resolved together with _ROBO_PM so the per-test hot path pays one global
+# load instead of a relay attribute lookup plus result-type branching per
+# test. Call as _ROBO_MODIFY_REPORT_ROW(report_row, test_data); always
+# returns a dict.
+_ROBO_MODIFY_REPORT_ROW = None
+
+
+def _get_robo_hook():
+    """
+    Build (once) and return the hook relay for the robo_* hookspecs.
+
+    On first call this creates a pluggy PluginManager, registers the
+    hookspecs from hookspec.py, and registers the first module found that
+    implements robo_modify_report_row — preferring the shared
+    src.robo_hooks module (O(1) sys.modules lookup), then falling back to
+    a scan of loaded conftest modules. Plain (unmarked) robo_* functions
+    are accepted so existing conftest files keep working.
+    """
+    global _ROBO_PM, _ROBO_MODIFY_REPORT_ROW
+    if _ROBO_PM is None:
+        import pluggy
+
+        from . import hookspec
+
+        class RoboPluginManager(pluggy.PluginManager):
+            def parse_hookimpl_opts(self, plugin, name):
+                opts = super().parse_hookimpl_opts(plugin, name)
+                if opts is None and name.startswith("robo_"):
+                    # Treat plain robo_* functions as implementations even
+                    # without an explicit @pytest.hookimpl marker
+                    opts = {}
+                return opts
+
+        _ROBO_PM = RoboPluginManager("pytest")
+        _ROBO_PM.add_hookspecs(hookspec)
+
+        hook_module = sys.modules.get("src.robo_hooks")
+        if hook_module is None or not hasattr(hook_module, "robo_modify_report_row"):
+            hook_module = None
+            for module_name in list(sys.modules):
+                if "conftest" not in module_name:
+                    continue
+                module = sys.modules.get(module_name)
+                if module is not None and hasattr(module, "robo_modify_report_row"):
+                    hook_module = module
+                    break
+        if hook_module is not None:
+            _ROBO_PM.register(hook_module)
+
+        def _modify_report_row(
+            report_row, test_data, _call=_ROBO_PM.hook.robo_modify_report_row
+        ):
+            # Result validation lives here, once, instead of per call site;
+            # the warning uses lazy %-formatting so nothing is built when
+            # implementations behave.
+            result = _call(report_row=report_row, test_data=test_data)
+            if isinstance(result, dict):
+                return result
+            if result is not None:
+                logger.warning(
+                    "robo_modify_report_row returned %s instead of dict, ignoring",
+                    type(result).__name__,
+                )
+            return report_row
+
+        _ROBO_MODIFY_REPORT_ROW = _modify_report_row
+
+    return _ROBO_PM.hook
+
+# Extracts the test-relative part of a Windows absolute selector path in a
+# single scan: everything from the first "tests"/"test" directory or
+# "test_*" file segment onwards (e.g. "C:/proj/tests/test_a.py::t" ->
+# "tests/test_a.py::t").
+_WIN_ABS_SELECTOR_RE = re.compile(
+    r"^[A-Za-z]:.*?/((?:tests?(?=/|$)|test_[^/]*)(?:/.*)?)$"
+)
+
+
+def _normalize_selector(arg):
+    """
+    Normalize a command-line test selector to a relative node-id prefix.
+
+    Returns the selector with path separators normalized, any Windows
+    drive-letter prefix trimmed to the test directory, and the
+    parametrization suffix ("[...]") removed.
+    """
+    normalized = arg.replace("\\", "/")
+
+    # Windows absolute path: trim to the test directory in one regex pass
+    if ":" in normalized.partition("::")[0]:
+        match = _WIN_ABS_SELECTOR_RE.match(normalized)
+        if match:
+            normalized = match.group(1)
+
+    # Remove parametrization indices like [0], [row_name], etc.
+    return normalized.partition("[")[0]
+
+# Memoization cache for parsed CSV/Excel test data, keyed by
+# (path, mtime_ns, size) so a file edited between runs is re-parsed.
+# Many tests commonly share one data file; without this each parametrized
+# test function re-parses the same file during collection.
+_TEST_DATA_CACHE = {}
+
+# Maps a test directory to its sibling data/ directory; avoids repeating
+# the dirname/join work for every test collected from the same directory
+_DATA_DIR_CACHE = {}
+
+
+def _cached_load_test_data(data_path):
+    """
+    Load test data through the session-level memoization cache.
+
+    Each unique data file is parsed exactly once per session; subsequent
+    tests sharing the file get the already-parsed row list. The cache key
+    includes mtime and size so stale entries are never served.
+    """
+    try:
+        st = os.stat(data_path)
+    except OSError:
+        # Missing file: delegate to load_test_data for its error handling
+        return load_test_data(data_path)
+
+    key = (str(data_path), st.st_mtime_ns, st.st_size)
+    rows = _TEST_DATA_CACHE.get(key)
+    if rows is None:
+        rows = load_test_data(data_path)
+        _TEST_DATA_CACHE[key] = rows
+    return rows
 
 
 # ============================================================================
@@ -112,6 +294,34 @@ def pytest_addoption(parser):
     )
 
 
+# ============================================================================
+# HOOK 1b: pytest_cmdline_main
+# Execution: After option parsing, before the session is created
+# Purpose: Pick a better default xdist distribution strategy
+# ============================================================================
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """
+    Default xdist distribution to worksteal when none was chosen.
+
+    worksteal lets idle workers take queued tests from busy ones, which
+    shortens the long tail typical of slow UI suites. tryfirst makes this
+    run before xdist's own pytest_cmdline_main, which would otherwise
+    promote an unspecified --dist to plain "load"; an explicit --dist (or
+    --dist-load) from the user always wins.
+    """
+    option = config.option
+    if (
+        config.pluginmanager.hasplugin("xdist")
+        and getattr(option, "numprocesses", None)
+        and getattr(option, "dist", "no") == "no"
+        and not getattr(option, "distload", False)
+    ):
+        option.dist = "worksteal"
+
+
 # ============================================================================
 # HOOK 2: pytest_plugin_registered
 # Execution: When each plugin is registered (after addoption)
@@ -129,13 +339,22 @@ def pytest_plugin_registered(plugin, manager):
     - Allows disabling parallel execution via environment configuration
     """
 
-    # Check if the registered plugin is the xdist dsession plugin
-    if str(plugin).find("xdist.dsession.DSession") != -1:
-        # Check PARALLEL_EXECUTION environment variable
-        parallel_execution = get_env("PARALLEL_EXECUTION", "N").strip()
-        if parallel_execution == "N":
-            logger.warning("Parallel execution disabled, unregistering pytest-xdist")
-            manager.unregister(plugin)
+    # Check if the registered plugin is the xdist dsession plugin.
+    # A type-name comparison avoids building a repr string for every
+    # plugin pytest registers at startup.
+    if type(plugin).__name__ != "DSession":
+        return
+
+    # Check PARALLEL_EXECUTION environment variable (.env may define it,
+    # and this hook can fire before pytest_configure); cache the result so
+    # repeated registrations don't re-read the environment
+    global _PARALLEL_EXECUTION
+    if _PARALLEL_EXECUTION is None:
+        _ensure_env_loaded()
+        _PARALLEL_EXECUTION = get_env("PARALLEL_EXECUTION", "N").strip()
+    if _PARALLEL_EXECUTION == "N":
+        logger.warning("Parallel execution disabled, unregistering pytest-xdist")
+        manager.unregister(plugin)
 
 
 # ============================================================================
@@ -152,34 +371,54 @@ def pytest_configure(config):
 
     Responsibilities:
     1. Store session start time for report duration calculation
-    2. Initialize test_results_summary list on config object
+    2. Initialize the results list in the config stash
     3. Store master config reference in global variable for xdist workers
 
-    Config attributes created:
-    - config.test_results_summary: List to collect test result dicts
-    - config._sessionstart_time: Session start datetime
+    Config stash entries created:
+    - RESULTS_STASH_KEY: List to collect test result dicts
+    - SESSION_START_STASH_KEY: Session start datetime
     - _MASTER_CONFIG: Global ref to master config for worker aggregation
 
     Note on hooks:
     - Project-specific hook implementations (robo_modify_report_row) in conftest.py
-      are discovered via direct module lookup in pytest_runtest_makereport
-    - pytest's hook discovery can't find hookimpls in modules loaded before hookspec
-      registration, so we use direct sys.modules lookup instead (more reliable)
-    """
-    # Discover and cache conftest module with hook implementation (optimization)
-    global _CONFTEST_HOOK_MODULE
-    if _CONFTEST_HOOK_MODULE is None:
-        for module_name, module in list(sys.modules.items()):
-            if "conftest" in module_name and hasattr(module, "robo_modify_report_row"):
-                _CONFTEST_HOOK_MODULE = module
-                break
-    
-    # Store session start time for HTML report duration calculation (master only)
-    if not hasattr(config, "workerinput") and not hasattr(config, "_sessionstart_time"):
-        config._sessionstart_time = datetime.now()
-
-    # Initialize test_results_summary on config (runs on both master and workers)
-    config.test_results_summary = []
+      are dispatched through a dedicated pluggy manager (see _get_robo_hook);
+      pytest's own manager only collects pytest_*-prefixed hookimpls
+    """
+    _ensure_env_loaded()
+
+    # Build the robo hook relay now that conftest modules are loaded
+    _get_robo_hook()
+
+    # The kit generates its own HTML report and never reads .pytest_cache,
+    # so cacheprovider's per-session cache read/write I/O (costly on slow
+    # or network filesystems) is disabled by default. The cache stays
+    # enabled when the user actually relies on it (--lf/--ff/--cache-show)
+    # or opts in with ROBO_KEEP_CACHE=1.
+    if (
+        get_env("ROBO_KEEP_CACHE") != "1"
+        and not config.getoption("lf", False)
+        and not config.getoption("failedfirst", False)
+        and not config.getoption("cacheshow", False)
+        and not config.getoption("cacheclear", False)
+    ):
+        # cacheprovider's own (tryfirst) pytest_configure has already run
+        # and registered the last-failed/new-first sub-plugins that do the
+        # actual cache writes, so those are blocked alongside the module.
+        # set_blocked also unregisters an already-registered plugin.
+        for plugin_name in ("cacheprovider", "lfplugin", "nfplugin"):
+            if config.pluginmanager.hasplugin(plugin_name):
+                config.pluginmanager.set_blocked(plugin_name)
+
+    # Store session start time for HTML report duration calculation (master
+    # only). The monotonic_ns baseline is what durations are computed from
+    # (integer math, immune to clock adjustments); the wall-clock datetime
+    # is kept only for display in the report header.
+    if not hasattr(config, "workerinput") and SESSION_START_STASH_KEY not in config.stash:
+        config.stash[SESSION_START_STASH_KEY] = datetime.now()
+        config.stash[SESSION_START_NS_STASH_KEY] = time.monotonic_ns()
+
+    # Initialize results list in the stash (runs on both master and workers)
+    config.stash[RESULTS_STASH_KEY] = []
 
     # Store master config in global for xdist aggregation (master only)
     global _MASTER_CONFIG
@@ -188,30 +427,41 @@ def pytest_configure(config):
 
 
 # ============================================================================
-# HOOK 4: pytest_sessionstart
-# Execution: After session object has been created and before collection starts
-# Purpose: Setup session-specific state before test collection
-# Runs on: Both master and worker processes
+# HOOK 3b: pytest_report_header
+# Execution: After configure, when the terminal header is rendered
+# Purpose: Announce the plugin and report destination in the run header
+# Runs on: Master process only (workers skip immediately)
 # ============================================================================
 
+_HEADER_CACHE = None  # Built once; pytest may render the header more than once
 
-def pytest_sessionstart(session):
+
+def pytest_report_header(config):
     """
-    Called at session initialization after test collection configuration.
+    Add a robo-reporter line to the pytest session header.
 
-    Responsibilities:
-    - Session state is now available
-    - Plugin setup is complete
-    - Ready to start test collection
+    The header content is constant for the lifetime of the process, so it
+    is built once and served from a module-level cache on any re-display.
+    Workers return immediately — only the master renders a header.
+    """
+    if hasattr(config, "workerinput"):
+        return None
 
-    Called after:
-    - pytest_configure (plugin setup)
-    - Command-line options registered
+    global _HEADER_CACHE
+    if _HEADER_CACHE is None:
+        from . import __version__
 
-    Called before:
-    - pytest_collection (test collection starts)
-    """
-    pass
+        title = config.getoption("robo_report_title", "Test Execution Report")
+        _HEADER_CACHE = [f"robo-reporter {__version__}: {title}"]
+    return _HEADER_CACHE
+
+
+# ============================================================================
+# HOOK 4: pytest_sessionstart — intentionally not implemented.
+# Runs after pytest_configure and before collection; the plugin has no
+# session-start work, and an empty implementation would still cost a pluggy
+# dispatch into a Python frame, so none is registered.
+# ============================================================================
 
 
 # ============================================================================
@@ -233,73 +483,51 @@ def pytest_collection(session):
     - Helps pytest_generate_tests skip parametrization for unselected tests
     - Reduces overhead when running specific tests instead of full suite
 
-    Config attributes created:
-    - config._specified_test_functions: Set of selected test node IDs
+    Config stash entries created:
+    - SELECTED_TESTS_STASH_KEY: frozenset of selected test node IDs
+    - SELECTED_PREFIXES_STASH_KEY: precomputed "::"-suffixed prefixes
     """
     config = session.config
-    specified_tests = set()
-
-    # Parse command line arguments to find test selectors (e.g., tests/test_file.py::test_name)
-    for arg in config.invocation_params.args:
-        # Skip pytest options (start with -)
-        if arg.startswith("-"):
-            continue
-
-        # Only process test selectors containing ::
-        if "::" not in arg:
-            continue
-
-        # Normalize path separators for cross-platform compatibility
-        normalized = arg.replace("\\", "/")
-
-        # Handle Windows absolute paths (e.g., C:/path/to/tests/test_file.py::test_name)
-        # Extract relative path from test directory onwards
-        if ":" in normalized.split("::")[0]:  # Has drive letter (Windows absolute path)
-            parts = normalized.split("/")
-            # Find test directory start (tests/, test/, or test_*.py)
-            for i, part in enumerate(parts):
-                if part in ("tests", "test") or part.startswith("test_"):
-                    normalized = "/".join(parts[i:])
-                    break
-
-        # Remove parametrization indices like [0], [row_name], etc.
-        normalized = normalized.split("[")[0]
 
-        specified_tests.add(normalized)
+    # Parse command line arguments for test selectors (e.g.
+    # tests/test_file.py::test_name), skipping pytest options (start with -)
+    # and non-selector arguments. A single frozenset comprehension keeps the
+    # build in BUILD_SET/SET_ADD opcodes instead of a method-lookup loop.
+    specified_tests = frozenset(
+        _normalize_selector(arg)
+        for arg in config.invocation_params.args
+        if not arg.startswith("-") and "::" in arg
+    )
 
-    # Store for use in pytest_generate_tests
-    config._specified_test_functions = specified_tests
+    # Store for use in pytest_generate_tests: a frozenset for exact-match
+    # lookups plus a precomputed "::"-suffixed prefix tuple so the per-test
+    # check is O(1) set membership + O(selectors) startswith, with no string
+    # splitting repeated per selector.
+    config.stash[SELECTED_TESTS_STASH_KEY] = specified_tests
+    config.stash[SELECTED_PREFIXES_STASH_KEY] = tuple(
+        s + "::" for s in specified_tests
+    )
 
 
 # ============================================================================
 # HOOK 6: pytest_collection_modifyitems
-# Execution: After test collection, before parametrization of individual tests
-# Purpose: Modify collected test items (reorder, filter, mark, etc.)
+# Execution: After test collection, before test execution
+# Purpose: Precompute per-item flags consumed on the per-test hot path
 # Runs on: Both master and worker processes
 # ============================================================================
 
 
 def pytest_collection_modifyitems(session, config, items):
     """
-    Modify collected test items before test execution.
-
-    Called after pytest_collection and before parametrization.
-    Allows plugins to:
-    - Filter or reorder tests
-    - Add marks to tests
-    - Modify test parameters
-    - Skip tests programmatically
+    Precompute per-item flags used by pytest_runtest_makereport.
 
-    Purpose:
-    - Reserved for future enhancements (filtering, reordering, etc.)
-    - Can add custom marks or modify test execution order
-
-    Args:
-        session: Test session object
-        config: Pytest config object
-        items: List of collected test items
+    fixturenames is a sequence, so checking "row" in it per teardown costs
+    an O(k) scan for every test. One pass here caches the answer as an
+    attribute on each item, turning the per-test check into a single
+    attribute fetch.
     """
-    pass
+    for item in items:
+        item._has_row_fixture = "row" in getattr(item, "fixturenames", ())
 
 
 # ============================================================================
@@ -343,14 +571,14 @@ def pytest_generate_tests(metafunc):
     config = metafunc.config
 
     # Optimization: If specific tests were requested, skip tests not in the selection
-    if (
-        hasattr(config, "_specified_test_functions")
-        and config._specified_test_functions
-    ):
-        is_requested = any(
-            test_nodeid.split("[")[0] == spec
-            or test_nodeid.split("[")[0].startswith(spec + "::")
-            for spec in config._specified_test_functions
+    specified_tests = config.stash.get(SELECTED_TESTS_STASH_KEY, None)
+    if specified_tests:
+        # Strip the parametrization suffix once, then do a direct set lookup
+        # with a prefix scan fallback for class/module-level selectors
+        base = test_nodeid.partition("[")[0]
+        is_requested = base in specified_tests or any(
+            base.startswith(prefix)
+            for prefix in config.stash[SELECTED_PREFIXES_STASH_KEY]
         )
         if not is_requested:
             return
@@ -361,12 +589,20 @@ def pytest_generate_tests(metafunc):
         logger.error(f"Cannot determine file path for test {test_nodeid}")
         return
 
-    # Load CSV data from data/ directory (sibling to test directory)
-    test_dir = Path(test_file_path).parent
-    data_path = test_dir.parent / "data" / csv_file
+    # Load CSV data from data/ directory (sibling to test directory).
+    # Plain os.path string joins here: this runs once per parametrized test
+    # during collection and pathlib object construction is far costlier.
+    # Many tests share a directory, so the data dir is cached per test dir.
+    test_dir = os.path.dirname(str(test_file_path))
+    data_dir = _DATA_DIR_CACHE.get(test_dir)
+    if data_dir is None:
+        data_dir = _DATA_DIR_CACHE[test_dir] = os.path.join(
+            os.path.dirname(test_dir), "data"
+        )
+    data_path = os.path.join(data_dir, csv_file)
 
-    # Load test data from CSV/Excel file
-    rows = load_test_data(data_path)
+    # Load test data from CSV/Excel file (memoized per session)
+    rows = _cached_load_test_data(data_path)
 
     if not rows:
         logger.error(
@@ -375,36 +611,39 @@ def pytest_generate_tests(metafunc):
         )
         pytest.fail(f"Data file '{csv_file}' could not be loaded from {data_path}")
 
-    metafunc.parametrize("row", rows)
+    # Deterministic per-row IDs (index plus name/title column when the
+    # data has one). Stable IDs are what lets the cacheprovider map a
+    # failure back to its exact row, so --lf/--ff re-run only the rows
+    # that failed instead of the whole file.
+    ids = []
+    for pos, row in enumerate(rows):
+        label = row.get("Test Case Name", "") or row.get("Title", "")
+        ids.append(f"row{pos}-{label}" if label else f"row{pos}")
+
+    # Optional skip predicate evaluated at parametrize time. Rows skipped
+    # here carry a skip mark, so pytest never runs their fixtures — unlike
+    # a runtime pytest.skip(), which still pays driver startup and
+    # navigation before the test body can bail out.
+    skip_when = marker.kwargs.get("skip_when")
+    if skip_when is not None:
+        skip_reason = marker.kwargs.get("skip_reason", "skipped by datafile skip_when")
+        skip_mark = pytest.mark.skip(reason=skip_reason)
+        rows = [
+            pytest.param(row, marks=skip_mark) if skip_when(row) else row
+            for row in rows
+        ]
+
+    metafunc.parametrize("row", rows, ids=ids)
 
 
 # ============================================================================
-# HOOK 8: pytest_collection_finish
-# Execution: After all tests have been collected
-# Purpose: Final opportunity to modify or inspect collected tests
-# Runs on: Both master and worker processes
+# HOOK 8: pytest_collection_finish — intentionally not implemented.
+# Runs once all items are collected and parametrized; nothing to log or
+# validate here yet, so no empty implementation is registered for pluggy
+# to dispatch into.
 # ============================================================================
 
 
-def pytest_collection_finish(session):
-    """
-    Called after collection of all test items is complete.
-
-    Process:
-    - All tests have been discovered and collected
-    - pytest_generate_tests has been called for all test functions
-    - Ready to begin test execution phase
-
-    Purpose:
-    - Log collection summary
-    - Reserved for future enhancements (reporting, validation, etc.)
-
-    Args:
-        session: Test session object containing all collected items
-    """
-    pass
-
-
 # ============================================================================
 # HOOK 9: pytest_runtest_makereport
 # Execution: For each test phase (setup, call, teardown) after phase completes
@@ -431,16 +670,18 @@ def pytest_runtest_makereport(item, call):
     - error_log: Exception message if test failed
 
     Data storage:
-    - Appended to config.test_results_summary (master and workers)
-    - Synced to workeroutput for xdist workers
+    - Appended to the RESULTS_STASH_KEY list (master and workers)
+    - Exported once to workeroutput in pytest_sessionfinish (xdist workers)
     """
 
-    # Store durations for each phase on the item
-    if not hasattr(item, "_phase_durations"):
-        item._phase_durations = {}
-
-    # Capture duration for this phase
-    item._phase_durations[call.when] = getattr(call, "duration", 0)
+    # Accumulate total duration across setup/call/teardown. The setup
+    # phase reassigns rather than adds, so rerun-style plugins that run
+    # the protocol again for the same item report each attempt's own
+    # duration instead of a running total of every prior attempt.
+    if call.when == "setup":
+        item._total_duration = getattr(call, "duration", 0.0)
+    else:
+        item._total_duration += getattr(call, "duration", 0.0)
 
     # Store call phase info for later use
     if call.when == "call":
@@ -453,70 +694,47 @@ def pytest_runtest_makereport(item, call):
 
     # Build test result data dictionary
     report_row = build_test_data(item)
-    test_data = item.funcargs.get("row", {}) if "row" in item.fixturenames else {}
+    # _has_row_fixture is precomputed in pytest_collection_modifyitems
+    test_data = (
+        item.funcargs.get("row", {})
+        if getattr(item, "_has_row_fixture", False)
+        else {}
+    )
 
-    # Allow source projects to modify/enrich the report row via conftest hook
+    # Allow source projects to modify/enrich the report row via the
+    # robo_modify_report_row hook. The adapter resolved in _get_robo_hook
+    # (built eagerly in pytest_configure) validates the result itself, so
+    # this path is a single call; the fallback only fires if configure was
+    # skipped somehow.
     final_report_row = report_row
 
-    # Use cached conftest module for better performance
-    if _CONFTEST_HOOK_MODULE is not None:
-        try:
-            result = _CONFTEST_HOOK_MODULE.robo_modify_report_row(
-                report_row=report_row, test_data=test_data
-            )
-            if result and isinstance(result, dict):
-                final_report_row = result
-            elif result is not None:
-                logger.warning(
-                    f"robo_modify_report_row returned {type(result).__name__} instead of dict, "
-                    f"ignoring result for test {item.nodeid}"
-                )
-        except Exception as e:
-            logger.error(
-                f"Error calling robo_modify_report_row for test {item.nodeid}: {e}",
-                exc_info=True
-            )
-
-    # Store result in config (initialized for both main and worker processes)
-    item.config.test_results_summary.append(final_report_row)
-
-    # For xdist workers: sync to workeroutput for master aggregation
-    if hasattr(item.config, "workeroutput"):
-        item.config.workeroutput["test_results_summary"] = list(
-            item.config.test_results_summary
+    try:
+        robo_modify = _ROBO_MODIFY_REPORT_ROW
+        if robo_modify is None:
+            _get_robo_hook()
+            robo_modify = _ROBO_MODIFY_REPORT_ROW
+        final_report_row = robo_modify(report_row, test_data)
+    except Exception as e:
+        logger.error(
+            f"Error calling robo_modify_report_row for test {item.nodeid}: {e}",
+            exc_info=True
         )
 
+    # Store result in the config stash (initialized for master and workers).
+    # On xdist workers the same list object is exported to workeroutput once
+    # in pytest_sessionfinish, so no per-test snapshot copy is needed here.
+    item.config.stash[RESULTS_STASH_KEY].append(final_report_row)
+
 
 # ============================================================================
-# HOOK 10: pytest_configure_node (xdist only)
-# Execution: When xdist worker node is being configured
-# Purpose: Initialize worker-specific configuration
-# Runs on: Worker processes only (not on master)
+# HOOK 10: pytest_configure_node (xdist only) — intentionally not
+# implemented. Worker result lists are initialized by each worker's own
+# pytest_configure, so there is no per-node setup; defining even a pass
+# body also breaks runs where xdist is absent (-p no:xdist), since pluggy
+# rejects implementations of unknown hookspecs.
 # ============================================================================
 
 
-def pytest_configure_node(node):
-    """
-    Configure individual xdist worker node.
-
-    Called for each worker process during parallel execution.
-    Only runs in worker processes, not in master process.
-
-    Responsibilities:
-    - Initialize worker-specific test results list
-    - Setup worker state for result collection
-    - Ensure worker isolation from master process
-
-    Args:
-        node: xdist WorkerController object representing the worker node
-
-    Note:
-    This hook is only called when running with pytest-xdist.
-    Does not run in serial execution mode.
-    """
-    pass
-
-
 # ============================================================================
 # HOOK 11: pytest_testnodedown (xdist only)
 # Execution: When xdist worker process terminates
@@ -525,12 +743,14 @@ def pytest_configure_node(node):
 # ============================================================================
 
 
+@pytest.hookimpl(optionalhook=True)
 def pytest_testnodedown(node, error):
     """
     Aggregate results from xdist worker process.
 
     Called once per worker after all tests finish on that worker.
-    Only runs in the master process.
+    Only runs in the master process. optionalhook keeps pluggy from
+    rejecting the plugin when xdist (the hookspec owner) is not loaded.
 
     Process:
     1. Get worker ID from node configuration
@@ -608,7 +828,17 @@ def pytest_sessionfinish(session, exitstatus):
     - Worker processes will not generate reports
     - This runs before pytest_unconfigure hook
     """
-    pass
+    # Release parsed test data; it is only needed during collection
+    _TEST_DATA_CACHE.clear()
+
+    # xdist worker: export the accumulated results to workeroutput once, by
+    # reference. xdist pickles workeroutput at worker shutdown, so assigning
+    # the live list here replaces the old per-test list(...) snapshot in
+    # pytest_runtest_makereport (O(N^2) copying across a worker's N tests).
+    if hasattr(session.config, "workeroutput"):
+        session.config.workeroutput["test_results_summary"] = session.config.stash[
+            RESULTS_STASH_KEY
+        ]
 
 
 # ============================================================================
@@ -635,7 +865,7 @@ def pytest_unconfigure(config):
     6. Save report to reports/ directory with timestamp
 
     Process:
-    - Aggregate results from config.test_results_summary (master)
+    - Aggregate results from the RESULTS_STASH_KEY list (master)
     - Aggregate results from config._test_results_from_workers (all workers)
     - Calculate summary statistics (total, passed, failed, skipped)
     - Render Jinja2 HTML template with chart data
@@ -660,19 +890,30 @@ def pytest_unconfigure(config):
     if hasattr(config, "workerinput"):
         return
 
-    # Get report configuration
-    start_time = getattr(config, "_sessionstart_time", None)
+    # Get report configuration. Session duration comes from the monotonic
+    # baseline (two integer reads); the wall-clock start time is only used
+    # for the report header.
+    start_time = config.stash.get(SESSION_START_STASH_KEY, None)
+    start_ns = config.stash.get(SESSION_START_NS_STASH_KEY, None)
+    elapsed_seconds = (
+        (time.monotonic_ns() - start_ns) / 1e9 if start_ns is not None else None
+    )
 
     # Generate HTML report
 
     # Aggregate test results from master and workers
     report_rows = aggregate_test_results(config)
 
+    # Nothing ran (e.g. --collect-only, empty filter): skip loading the
+    # Jinja template and writing an empty report
+    if not report_rows:
+        return
+
     # # Print results summary to console
     # print_results_summary(report_rows)
 
     # Create summary object matching template expectations
-    report_summary = create_report_summary(report_rows, start_time)
+    report_summary = create_report_summary(report_rows, start_time, elapsed_seconds)
 
     try:
         generate_report(report_rows, report_summary, start_time)
@@ -701,7 +942,7 @@ def row(request):
         '''Test login with parametrized data.
 
         Args:
-            row: Dict containing one row from TestData.csv
+            row: Dict-like mapping for one row from TestData.csv
             driver: Selenium WebDriver instance
             wait: WebDriverWait with configured timeout
         '''
@@ -718,54 +959,155 @@ def row(request):
     - Example: data/TestData.csv → loaded for tests in tests/test_Template.py
 
     Encoding Support:
-    - CSV: utf-8-sig, latin-1, utf-8 (tries all with fallback)
+    - CSV: encoding sniffed once from the file head (utf-8-sig on a BOM,
+      utf-8 when it decodes cleanly, latin-1 otherwise)
     - Excel: .xlsx files via openpyxl library
 
     Row Data:
-    - Each row is converted to a dict with column headers as keys
+    - Each row is a dict-like mapping keyed by column header, with the
+      columns also readable as attributes (row.Value_1 for "Value 1")
     - Empty cells are converted to empty strings (not NaN or None)
-    - All values are strings (numeric values must be converted in test)
+    - Columns whose populated cells all parse as numbers arrive as
+      int/float (a single float cell promotes the whole column);
+      mixed or textual columns stay strings
 
     Request Parameter:
     - Provided automatically by pytest
-    - request.param contains the parametrized value (the row dict)
+    - request.param contains the parametrized value (the row mapping)
     """
     return request.param
 
 
-@pytest.fixture(scope="function")
-def driver(request):
+# Session-constant fixture settings, parsed once on first use (after the
+# .env load in pytest_configure) instead of per test; get_env caches the
+# raw strings, but the upper()/int() parsing would still run per call
+_HEADLESS = None
+_WAIT_TIMEOUT = None
+
+
+def _is_headless():
+    global _HEADLESS
+    if _HEADLESS is None:
+        _HEADLESS = get_env("HEADLESS", "N").upper() == "Y"
+    return _HEADLESS
+
+
+def _get_wait_timeout():
+    global _WAIT_TIMEOUT
+    if _WAIT_TIMEOUT is None:
+        _WAIT_TIMEOUT = int(get_env("WAIT_TIME", "15"))
+    return _WAIT_TIMEOUT
+
+
+def _discard_profile_dir(profile_dir):
     """
-    Fixture that provides a Chrome WebDriver instance with a unique profile.
+    Remove a Chrome profile directory without blocking teardown.
 
-    SCOPE: Function-scoped (created/destroyed for each test)
+    Profile dirs hold thousands of small files and rmtree's filesystem
+    walk can take hundreds of milliseconds. The directory is atomically
+    renamed out of the way first (so the path is immediately reusable)
+    and then deleted in a daemon thread, letting the finalizer return
+    right away.
+    """
+    if not profile_dir:
+        return
+    doomed = profile_dir + ".dead"
+    try:
+        os.rename(profile_dir, doomed)
+    except OSError:
+        doomed = profile_dir
+    threading.Thread(
+        target=shutil.rmtree,
+        args=(doomed,),
+        kwargs={"ignore_errors": True},
+        daemon=True,
+    ).start()
+
+
+def _launch_chrome():
+    """
+    Start Chrome with a fresh temporary profile directory.
+
+    Returns a (driver, profile_dir) pair; the caller owns cleanup of both.
+    """
+    webdriver, Options, _ = _get_webdriver_classes()
+
+    # Create a temporary directory for the unique profile; the xdist worker
+    # id in the name keeps per-worker profiles apart and easy to attribute
+    # when inspecting a busy temp dir (mkdtemp already guarantees
+    # uniqueness, including on non-xdist runs where the id is "master")
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "master")
+    profile_dir = tempfile.mkdtemp(prefix=f"chrome_profile_{worker}_")
+
+    chrome_options = Options()
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+
+    # Check HEADLESS environment variable (Y = headless, N = visible)
+    if _is_headless():
+        chrome_options.add_argument("--headless=new")
+
+    return webdriver.Chrome(options=chrome_options), profile_dir
+
+
+@pytest.fixture(scope="session")
+def _driver_pool():
+    """
+    Session-scoped holder for the shared Chrome instance.
+
+    The browser itself is launched lazily by the driver fixture on first
+    use, so sessions that never request a driver pay nothing. The
+    finalizer quits whatever browser is still alive at session end and
+    removes its temporary profile.
+    """
+    pool = {"driver": None, "profile_dir": None}
+
+    yield pool
+
+    if pool["driver"] is not None:
+        try:
+            pool["driver"].quit()
+        except Exception:
+            pass
+    _discard_profile_dir(pool["profile_dir"])
 
-    Automatically handles:
-    - Creating unique browser profile (isolated from other tests)
-    - Setting headless mode based on HEADLESS environment variable
-    - Cleanup and profile directory removal on test completion
+
+@pytest.fixture(scope="function")
+def driver(request, _driver_pool):
+    """
+    Fixture that provides a Chrome WebDriver instance.
+
+    SCOPE: Function-scoped handle to a browser reused for the whole
+    session (one Chrome cold-start per pytest process / xdist worker).
+    Between tests the browser is reset in place — cookies and
+    localStorage/sessionStorage are cleared but the last page stays
+    loaded, so a following test targeting the same URL can skip its
+    driver.get() round-trip. Tests that need a pristine page or state
+    beyond cookies/web storage should set ROBO_ISOLATED_BROWSER=Y.
 
     Environment Variables:
     - HEADLESS (default: "N")
       - "Y" = Run browser in headless mode (no GUI)
       - "N" = Run browser with visible window
       - Useful for CI/CD environments vs. local debugging
+    - ROBO_ISOLATED_BROWSER (default: "N")
+      - "Y" = Launch a dedicated Chrome with its own profile per test
+        (the previous behavior) for suites that need hard isolation
+        (e.g. tests that poison browser-level state beyond cookies)
 
     Browser Configuration:
-    - --user-data-dir: Unique temporary profile directory per test
+    - --user-data-dir: Unique temporary profile directory per browser
     - --no-sandbox: Required for some environments
     - --disable-dev-shm-usage: Prevents shared memory issues
     - --headless=new: Modern headless implementation (if HEADLESS="Y")
 
-    Profile Isolation:
-    - Each test gets its own temporary profile directory
-    - Profile directory is automatically cleaned up after test
-    - Prevents cache/cookie contamination between tests
-
     Cleanup:
-    - Automatically called via pytest finalizer
-    - Calls driver.quit() to close browser
-    - Removes temporary profile directory recursively
+    - Shared browser: cookies + web storage cleared after each test with
+      the page left loaded; quit() and profile removal once at session end
+    - Isolated browser: quit() and profile removal after each test
+    - A browser that stops responding during reset is retired so the
+      next test transparently gets a fresh one
 
     Usage:
     ======
@@ -786,40 +1128,61 @@ def driver(request):
 
     Args:
         request: pytest request fixture (provided by pytest)
+        _driver_pool: session-scoped browser holder (provided by plugin)
 
     Returns:
         Selenium WebDriver instance for Chrome browser
     """
-    # Create a temporary directory for the unique profile
-    profile_dir = tempfile.mkdtemp(prefix="chrome_profile_")
-    profile_name = os.path.basename(profile_dir)
+    # Opt-out: one dedicated browser + profile per test
+    if get_env("ROBO_ISOLATED_BROWSER", "N").upper() == "Y":
+        driver, profile_dir = _launch_chrome()
 
-    chrome_options = Options()
-    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
+        def finalizer():
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            _discard_profile_dir(profile_dir)
 
-    # Check HEADLESS environment variable (Y = headless, N = visible)
-    headless = get_env("HEADLESS", "N")
-    if headless.upper() == "Y":
-        chrome_options.add_argument("--headless=new")
+        request.addfinalizer(finalizer)
 
-    driver = webdriver.Chrome(options=chrome_options)
+        yield driver
+        return
+
+    driver = _driver_pool["driver"]
+    if driver is None:
+        driver, _driver_pool["profile_dir"] = _launch_chrome()
+        _driver_pool["driver"] = driver
+
+    yield driver
 
-    # Register a finalizer to always clean up driver and profile directory
-    def finalizer():
+    # Reset browser state for the next test; if the browser is wedged,
+    # retire it so the next test cold-starts a fresh one. Cookies and web
+    # storage are cleared in place (tolerating pages that disallow storage
+    # access) and the page itself stays loaded, so that a following test
+    # navigating to the same URL can skip the round-trip entirely (see
+    # _last_url in the navigation short-circuit).
+    try:
+        driver.delete_all_cookies()
         try:
-            driver.quit()
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
         except Exception:
             pass
+        # Invalidate the short-circuit only if the test moved off the page
+        # it recorded; otherwise the next same-URL test skips its get()
+        if driver.current_url != getattr(driver, "_last_url_resolved", None):
+            driver._last_url = None
+    except Exception:
         try:
-            shutil.rmtree(profile_dir, ignore_errors=True)
+            driver.quit()
         except Exception:
             pass
-
-    request.addfinalizer(finalizer)
-
-    yield driver
+        _discard_profile_dir(_driver_pool["profile_dir"])
+        _driver_pool["driver"] = None
+        _driver_pool["profile_dir"] = None
 
 
 @pytest.fixture()
@@ -863,5 +1226,30 @@ def wait(driver):
     Returns:
         WebDriverWait instance with configured timeout
     """
-    timeout = int(get_env("WAIT_TIME", "15"))
-    return WebDriverWait(driver, timeout)
+    _, _, WebDriverWait = _get_webdriver_classes()
+    return WebDriverWait(driver, _get_wait_timeout())
+
+
+@pytest.fixture(scope="session")
+def app_url():
+    """
+    Session-scoped application URL from the APP_URL environment variable.
+
+    SCOPE: Session-scoped (resolved and validated once per session)
+
+    Purpose:
+    - Hands every test the target URL without a per-test env lookup
+    - Fails once, up front, when APP_URL is missing or blank, instead of
+      repeating the same assertion failure for every parametrized row
+
+    Usage:
+    ======
+    def test_open_app(driver, app_url):
+        driver.get(app_url)
+
+    Returns:
+        The configured application URL string
+    """
+    url = get_env("APP_URL")
+    assert url and url.strip(), "APP_URL environment variable is not set."
+    return url
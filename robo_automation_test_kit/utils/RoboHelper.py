@@ -1,9 +1,13 @@
 # Report generation utilities and helpers
+import functools
 import tomllib
 from .reports.HtmlReportUtils import get_html_template
+import codecs
+import csv
+import gzip
+from collections import Counter
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
-from datetime import datetime
+from datetime import datetime, timedelta
 import zipfile
 import os
 import logging
@@ -16,74 +20,241 @@ logger.propagate = True
 
 def profile_name_from_driver(driver) -> str:
 
-    # Log profile name from driver user-data-dir argument
-    profile_name: str = ""
-    for arg in driver.options.arguments:
-        if arg.startswith("--user-data-dir="):
-            profile_dir = arg.split("=", 1)[1]
-            profile_name = os.path.basename(profile_dir)
-            break
+    # Cached on the driver: the profile never changes for a driver's
+    # lifetime, so the arguments scan runs at most once per instance
+    cached = getattr(driver, "_robo_profile_name", None)
+    if cached is not None:
+        return cached
+
+    # Profile name comes from the driver user-data-dir argument
+    arg = next(
+        (a for a in driver.options.arguments if a.startswith("--user-data-dir=")),
+        None,
+    )
+    profile_name = os.path.basename(arg.split("=", 1)[1]) if arg else ""
+    try:
+        driver._robo_profile_name = profile_name
+    except AttributeError:
+        pass  # driver may forbid new attributes; just recompute next time
 
     return profile_name
 
 
+class _Row:
+    """Lightweight read-only mapping over a shared column index.
+
+    Every row from one data file holds just a tuple of cell values plus a
+    reference to a single column->position dict shared across the file,
+    instead of a full per-row dict (hash table + per-row key references).
+    Implements the mapping surface the plugin and hook implementations
+    actually use (.get, [], in, iteration, keys/items), so callers treat
+    it exactly like the dict rows it replaces. Columns are also exposed
+    as attributes, namedtuple-style, with underscores standing in for
+    spaces (row.Value_1 reads the "Value 1" column); attribute access
+    skips the transient default argument of .get on hot per-row paths.
+    """
+
+    __slots__ = ("_index", "_values")
+
+    def __init__(self, index, values):
+        self._index = index
+        self._values = values
+
+    def __getitem__(self, key):
+        return self._values[self._index[key]]
+
+    def get(self, key, default=None):
+        try:
+            return self._values[self._index[key]]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def values(self):
+        return self._values
+
+    def items(self):
+        return zip(self._index, self._values)
+
+    def __getattr__(self, name):
+        # Only reached for names not in __slots__. Underscored attribute
+        # spellings map to space-separated column names; leading-underscore
+        # names stay AttributeErrors so protocol probes (pickle etc.) are
+        # not swallowed.
+        if not name.startswith("_"):
+            index = self._index
+            pos = index.get(name)
+            if pos is None:
+                pos = index.get(name.replace("_", " "))
+            if pos is not None:
+                return self._values[pos]
+        raise AttributeError(name)
+
+    def __repr__(self):
+        return f"_Row({dict(self.items())!r})"
+
+
+def _build_rows(header, value_rows):
+    """Wrap an iterable of value tuples as _Row objects sharing one index."""
+    index = {key: pos for pos, key in enumerate(header)}
+    return [_Row(index, values) for values in value_rows]
+
+
+def _coerce_numeric_columns(value_rows):
+    """Cast CSV columns whose every non-empty cell parses as a number.
+
+    csv.reader yields strings, so numeric test data would otherwise be
+    compared lexicographically in tests ("10" < "9"). Columns where all
+    populated cells parse as int (or float, if any cell needs it) are
+    converted once here; mixed or textual columns pass through unchanged
+    and empty cells stay "".
+    """
+    if not value_rows:
+        return value_rows
+    converters = []
+    for col in range(len(value_rows[0])):
+        conv = int
+        for row in value_rows:
+            cell = row[col]
+            if cell == "":
+                continue
+            try:
+                int(cell)
+            except ValueError:
+                try:
+                    float(cell)
+                except ValueError:
+                    conv = None
+                    break
+                conv = float
+        converters.append(conv)
+    if not any(converters):
+        return value_rows
+    return [
+        tuple(
+            conv(cell) if conv is not None and cell != "" else cell
+            for conv, cell in zip(converters, row)
+        )
+        for row in value_rows
+    ]
+
+
+def _load_excel_rows(path):
+    """Stream rows from an .xlsx workbook without loading it fully.
+
+    Uses openpyxl's read-only mode, which parses the sheet XML
+    incrementally (SAX-style) instead of building the whole workbook in
+    memory. Cell values are normalized to strings with empty cells as "".
+    """
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows_iter = workbook.active.iter_rows(values_only=True)
+        header = next(rows_iter, None)
+        if header is None:
+            return []
+        header = tuple("" if cell is None else str(cell) for cell in header)
+        # Stringify like the CSV path, then re-type numeric columns through
+        # the shared coercion pass so both formats yield identical rows
+        # (openpyxl's native ints/floats survive the str round-trip)
+        value_rows = [
+            tuple("" if cell is None else str(cell) for cell in row)
+            for row in rows_iter
+        ]
+        return _build_rows(header, _coerce_numeric_columns(value_rows))
+    finally:
+        workbook.close()
+
+
 def load_test_data(path: Path):
-    """Load test data rows from CSV or Excel file using pandas.
+    """Load test data rows from CSV or Excel file.
 
     Supports multiple file formats and encodings:
-    - CSV files with utf-8-sig, latin-1, or utf-8 encoding
-    - Excel workbooks (.xlsx)
+    - CSV files with utf-8-sig, latin-1, or utf-8 encoding (stdlib csv)
+    - Excel workbooks (.xlsx) streamed via openpyxl read-only mode
 
-    Returns a list of dict rows suitable for pytest parametrization.
+    Returns a list of dict-like _Row mappings suitable for pytest
+    parametrization; all rows from one file share a single column index.
     """
 
-    # Print to stderr to ensure visibility in xdist mode
-    import sys
-
     # Validate file exists
     if not os.path.exists(path):
         logger.error(f"Data file not found: {path}")
         return []
 
-    try:
-        import pandas as pd
-    except ImportError:
-        logger.error("pandas not installed; cannot load data file")
-        return []
-
     try:
         if zipfile.is_zipfile(path):
-            df = pd.read_excel(
-                path, engine="openpyxl", dtype=str, keep_default_na=False
-            )
+            return _load_excel_rows(path)
+
+        # CSV: stdlib csv.reader feeding the shared-index row representation.
+        # This keeps pandas (and its import cost, paid once per pytest
+        # worker) off the collection path entirely.
+        #
+        # Sniff the encoding once from the first 64KB instead of retrying
+        # a full parse per candidate encoding: BOM means utf-8-sig, a clean
+        # utf-8 decode means utf-8, anything else falls back to latin-1
+        # (which decodes any byte sequence).
+        with open(path, "rb") as f:
+            head = f.read(65536)
+        if head.startswith(codecs.BOM_UTF8):
+            enc = "utf-8-sig"
         else:
-            df = None
-            for enc in ("utf-8-sig", "latin-1", "utf-8"):
-                try:
-                    df = pd.read_csv(
-                        path, encoding=enc, dtype=str, keep_default_na=False
-                    )
-                    break
-                except UnicodeDecodeError:
-                    df = None
-            if df is None:
-                logger.error(
-                    f"Could not load CSV file {path} with any supported encoding"
-                )
+            try:
+                head.decode("utf-8")
+                enc = "utf-8"
+            except UnicodeDecodeError:
+                enc = "latin-1"
+
+        with open(path, newline="", encoding=enc) as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None:
                 return []
-        df = df.fillna("")
-
-        return df.to_dict(orient="records")
+            width = len(header)
+            # Pad/trim ragged rows to the header width, matching the old
+            # pandas behavior of "" for missing cells
+            value_rows = [
+                tuple(row)
+                if len(row) == width
+                else tuple((row + [""] * width)[:width])
+                for row in reader
+            ]
+            return _build_rows(tuple(header), _coerce_numeric_columns(value_rows))
     except Exception as exc:
         logger.error(f"Error loading data file {path}: {exc}", exc_info=True)
         return []
 
 
+# Memoized environment lookups; get_env is called from per-plugin and
+# per-test hot paths where re-reading os.environ each time is wasted work
+_ENV_CACHE = {}
+
+
 def get_env(key: str, default: str = "") -> str:
-    value = os.getenv(key, default).strip()
+    try:
+        value = _ENV_CACHE[key]
+    except KeyError:
+        value = _ENV_CACHE[key] = os.getenv(key, "").strip()
     return value if value else default
 
 
+def invalidate_env_cache():
+    """Clear memoized env values; call after load_dotenv mutates os.environ."""
+    _ENV_CACHE.clear()
+
+
 def extract_test_case_name_from_docstring(item, report):
     """Extract test case name from function docstring or nodeid."""
     docstring = str(item.function.__doc__)
@@ -93,63 +264,147 @@ def extract_test_case_name_from_docstring(item, report):
         return report.nodeid
 
 
+# (display label, result dict key) pairs for the console results table
+_SUMMARY_COLUMNS = (
+    ("Status", "test_status"),
+    ("Title", "title"),
+    ("Phase", "Phase"),
+    ("Request Category", "Request Category"),
+    ("Request Sub Category", "Request Sub Category"),
+    ("Center", "Center"),
+    ("Duration", "duration"),
+    ("Error Log", "error_log"),
+    ("Test Name", "test_name"),
+)
+
+# Below this many rows the per-row format loop is cheaper than building a
+# DataFrame; above it pandas tabulates in C-level passes
+_PANDAS_SUMMARY_THRESHOLD = 64
+
+# Below this many rows the Counter loop wins; above it numpy counts the
+# statuses in one C-level unique pass
+_NUMPY_TALLY_THRESHOLD = 512
+
+
+def _tally_statuses(report_rows):
+    """
+    Count test_status values across report_rows in a single pass.
+
+    Returns a mapping of status string to occurrence count. Large sessions
+    take a vectorized numpy path (fixed-width string array + np.unique);
+    small ones, or environments without numpy, use a plain Counter.
+    """
+    if len(report_rows) >= _NUMPY_TALLY_THRESHOLD:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None:
+            statuses = np.fromiter(
+                (r.get("test_status", "") for r in report_rows),
+                dtype="U16",
+                count=len(report_rows),
+            )
+            vals, cnts = np.unique(statuses, return_counts=True)
+            return dict(zip(vals.tolist(), cnts.tolist()))
+    return Counter(r.get("test_status", "") for r in report_rows)
+
+
+def _results_table_pandas(pd, all_results):
+    """Tabulate results with pandas instead of a per-row format loop."""
+    df = pd.DataFrame(all_results)
+    for _, key in _SUMMARY_COLUMNS:
+        if key not in df.columns:
+            df[key] = ""
+
+    # Numeric durations become HH:MM:SS; non-numeric values pass through
+    seconds = pd.to_numeric(df["duration"], errors="coerce")
+    formatted = (
+        pd.to_timedelta(seconds.fillna(0).astype(int), unit="s")
+        .astype(str)
+        .str.split(" ")
+        .str[-1]  # drop the "0 days" prefix
+    )
+    df["duration"] = formatted.where(seconds.notna(), df["duration"].astype(str))
+
+    table = df[[key for _, key in _SUMMARY_COLUMNS]]
+    table.columns = [label for label, _ in _SUMMARY_COLUMNS]
+    return table.to_string(index=False)
+
+
 def print_results_summary(all_results):
 
     header = "{:<10} {:<30} {:<10} {:<10} {:<20} {:<20} {:<10} {:<10} {:<20}".format(
-        "Status",
-        "Title",
-        "Phase",
-        "Request Category",
-        "Request Sub Category",
-        "Center",
-        "Duration",
-        "Error Log",
-        "Test Name",
+        *(label for label, _ in _SUMMARY_COLUMNS)
     )
     sep = "-" * 150
-    print("\nTest Results Summary:")
-    print(header)
-    print(sep)
+    # Accumulate the whole summary and write it with one print; each
+    # print() call re-enters the (possibly captured/teed) stream and
+    # flushes, so one write beats one per row
+    lines = ["", "Test Results Summary:", header, sep]
+
     if not all_results:
-        print(sep)
+        lines.append(sep)
+        print("\n".join(lines))
         return
-    for result in all_results:
-        # If duration is a float or int, format as HH:MM:SS
-        duration_val = result.get("duration", "")
-        if isinstance(duration_val, (float, int)):
-            hours = int(duration_val // 3600)
-            minutes = int((duration_val % 3600) // 60)
-            seconds = int(duration_val % 60)
-            duration_str = f"{hours:02}:{minutes:02}:{seconds:02}"
-        else:
-            duration_str = str(duration_val)
-        row = "{:<10} {:<30} {:<10} {:<10} {:<20} {:<20} {:<10} {:<10} {:<20}".format(
-            result.get("test_status", ""),
-            result.get("title", ""),
-            result.get("Phase", ""),
-            result.get("Request Category", ""),
-            result.get("Request Sub Category", ""),
-            result.get("Center", ""),
-            duration_str,
-            result.get("error_log", ""),
-            result.get("test_name", ""),
-        )
-        print(row)
-    print(sep)
+
+    # For large result sets let pandas format the table in vectorized
+    # passes; the Python loop below stays as the small-N / no-pandas path
+    table = None
+    if len(all_results) > _PANDAS_SUMMARY_THRESHOLD:
+        try:
+            import pandas as pd
+        except ImportError:
+            pd = None
+        if pd is not None:
+            table = _results_table_pandas(pd, all_results)
+
+    if table is not None:
+        lines.append(table)
+    else:
+        for result in all_results:
+            # If duration is a float or int, format as H:MM:SS; timedelta's
+            # C-level str() replaces three divmods plus an f-string per row
+            duration_val = result.get("duration", "")
+            if isinstance(duration_val, (float, int)):
+                duration_str = str(timedelta(seconds=int(duration_val)))
+            else:
+                duration_str = str(duration_val)
+            lines.append(
+                "{:<10} {:<30} {:<10} {:<10} {:<20} {:<20} {:<10} {:<10} {:<20}".format(
+                    result.get("test_status", ""),
+                    result.get("title", ""),
+                    result.get("Phase", ""),
+                    result.get("Request Category", ""),
+                    result.get("Request Sub Category", ""),
+                    result.get("Center", ""),
+                    duration_str,
+                    result.get("error_log", ""),
+                    result.get("test_name", ""),
+                )
+            )
+    lines.append(sep)
+    print("\n".join(lines))
 
 
 # Flatten if results is a list of lists or dicts
 def flatten_results(res, cfg):
-    """Flatten and aggregate test results from workers."""
+    """Flatten and aggregate test results from workers.
+
+    Workers hand back a flat list[dict], so that shape is extend()ed in
+    one C-level call; recursion only kicks in for nested-list payloads.
+    """
     if cfg is None:
         return
     if isinstance(res, dict):
         cfg._test_results_from_workers.append(res)
     elif isinstance(res, list):
-        for x in res:
-            flatten_results(x, cfg)
-    else:
-        pass
+        if all(isinstance(r, dict) for r in res):
+            # Common case: one extend instead of a Python frame per entry
+            cfg._test_results_from_workers.extend(res)
+        else:
+            for x in res:
+                flatten_results(x, cfg)
 
 
 def build_test_data(item):
@@ -177,14 +432,11 @@ def build_test_data(item):
         status = "PASSED"
         error_log = ""
     else:
-        # Safely extract error message
+        # Safely extract the one-line error message. exconly() formats just
+        # "ExceptionType: message" — same text reprcrash.message carried —
+        # without getrepr() rendering the full traceback per failed test.
         try:
-            error_repr = call_excinfo.getrepr()
-            error_log = (
-                error_repr.reprcrash.message
-                if error_repr.reprcrash
-                else str(call_excinfo.value)
-            )
+            error_log = call_excinfo.exconly()
         except (AttributeError, Exception):
             error_log = (
                 str(call_excinfo.value) if call_excinfo.value else "Unknown error"
@@ -195,8 +447,9 @@ def build_test_data(item):
             status = "SKIPPED"
         else:
             status = "FAILED"
-    # Calculate total duration (setup + call + teardown)
-    total_duration = sum(item._phase_durations.values())
+    # Total duration (setup + call + teardown) accumulated per phase in
+    # pytest_runtest_makereport
+    total_duration = getattr(item, "_total_duration", 0.0)
 
     test_id = getattr(item, "name", item.nodeid)
 
@@ -220,7 +473,7 @@ def aggregate_test_results(config):
     """
     Aggregate test results from master process and xdist workers.
 
-    Collects results from config.test_results_summary (master process)
+    Collects results from the RESULTS_STASH_KEY stash list (master process)
     and config._test_results_from_workers (aggregated worker results).
 
     Args:
@@ -231,10 +484,16 @@ def aggregate_test_results(config):
     """
     report_rows = []
 
-    # Include results from config.test_results_summary (initialized in pytest_configure)
-    if hasattr(config, "test_results_summary") and config.test_results_summary:
-        master_results = [r for r in config.test_results_summary if isinstance(r, dict)]
-        report_rows.extend(master_results)
+    # Include results from the config stash (initialized in pytest_configure).
+    # extend() consumes the filtering generators directly, with no
+    # intermediate throwaway lists. The stash key lives in plugin (which
+    # owns the pytest import); resolving it here at call time avoids a
+    # module-level import cycle.
+    from robo_automation_test_kit.plugin import RESULTS_STASH_KEY
+
+    master_summary = config.stash.get(RESULTS_STASH_KEY, None)
+    if master_summary:
+        report_rows.extend(r for r in master_summary if isinstance(r, dict))
 
     # Include results from xdist workers (aggregated via pytest_testnodedown)
     if (
@@ -245,49 +504,58 @@ def aggregate_test_results(config):
             if isinstance(entry, dict):
                 report_rows.append(entry)
             elif isinstance(entry, list):
-                worker_results = [r for r in entry if isinstance(r, dict)]
-                report_rows.extend(worker_results)
+                report_rows.extend(r for r in entry if isinstance(r, dict))
 
     return report_rows
 
 
-def create_report_summary(report_rows, start_time=None):
+def create_report_summary(report_rows, start_time=None, elapsed_seconds=None):
     """
     Create summary object for HTML report template.
 
     Args:
         report_rows: List of test result dictionaries
-        start_time: Datetime object for test session start
+        start_time: Datetime object for test session start (display fallback)
+        elapsed_seconds: Session duration from the monotonic clock; preferred
+            over start_time subtraction since it is immune to wall-clock
+            adjustments and avoids datetime arithmetic
 
     Returns:
         Dictionary containing summary statistics for the report
     """
     # Calculate test duration
-    if start_time:
+    if elapsed_seconds is not None:
+        duration_str = format_duration(int(elapsed_seconds))
+    elif start_time:
         end_time = datetime.now()
         duration = end_time - start_time
         duration_str = str(duration).split(".")[0]  # Remove microseconds
     else:
         duration_str = ""
 
-    # Calculate summary statistics
+    # Calculate summary statistics in a single pass over the rows instead
+    # of one generator scan (and one dict lookup per row) per status
     total = len(report_rows)
-    passed = sum(1 for r in report_rows if r.get("test_status") == "PASSED")
-    failed = sum(1 for r in report_rows if r.get("test_status") in ["ERROR", "FAILED"])
-    skipped = sum(1 for r in report_rows if r.get("test_status") == "SKIPPED")
-
+    counts = _tally_statuses(report_rows)
+    passed = counts.get("PASSED", 0)
+    failed = counts.get("FAILED", 0) + counts.get("ERROR", 0)
+    skipped = counts.get("SKIPPED", 0)
+
+    # One clock read for both formatted stamps; env values go through the
+    # session-cached get_env instead of hitting os.environ per report
+    now = datetime.now()
     return {
-        "env_name": os.getenv("APP_ENV", "").upper(),
-        "project_name": os.getenv("PROJECT_NAME", ""),
-        "test_framework": os.getenv("TEST_FRAMEWORK", "Robo Automation Framework"),
+        "env_name": get_env("APP_ENV").upper(),
+        "project_name": get_env("PROJECT_NAME"),
+        "test_framework": get_env("TEST_FRAMEWORK", "Robo Automation Framework"),
         "total": total,
         "duration": duration_str,
         "passed": passed,
         "failed": failed,
         "skipped": skipped,
         "rerun": 0,  # Not tracked in current implementation
-        "generated_date": datetime.now().strftime("%m-%d-%Y"),
-        "generated_time": datetime.now().strftime("%I:%M:%S %p"),
+        "generated_date": now.strftime("%m-%d-%Y"),
+        "generated_time": now.strftime("%I:%M:%S %p"),
     }
 
 
@@ -309,6 +577,89 @@ def format_duration(seconds):
     return str(seconds)
 
 
+# Package-internal asset locations, resolved once at import instead of
+# rebuilding the Path chain on every report
+_PACKAGE_DIR = Path(__file__).resolve().parent.parent
+_SCRIPTS_DIR = _PACKAGE_DIR / "templates" / "html_report" / "scripts"
+
+# (template variable, asset path relative to the scripts dir) pairs for
+# the CSS/JS files embedded into the HTML report
+_EMBEDDED_ASSETS = (
+    ("embedded_css", "css/report.css"),
+    ("embedded_material_icons", "css/material-icons.css"),
+    ("embedded_robo_fonts", "css/robo-fonts.css"),
+    ("embedded_chart_js", "js/chart.js"),
+    ("embedded_report_js", "js/report.js"),
+)
+
+
+def _minify_asset(rel_path, content):
+    """
+    Minify an embedded asset when rjsmin/rcssmin are installed.
+
+    Both are optional pure-Python minifiers; without them the raw content
+    is embedded unchanged. Callers cache the result, so minification runs
+    at most once per asset per process.
+    """
+    try:
+        if rel_path.endswith(".js"):
+            import rjsmin
+
+            return rjsmin.jsmin(content)
+        if rel_path.endswith(".css"):
+            import rcssmin
+
+            return rcssmin.cssmin(content)
+    except ImportError:
+        pass
+    return content
+
+
+@functools.lru_cache(maxsize=1)
+def _load_embedded_assets():
+    """
+    Read the CSS/JS assets embedded into the report, once per process.
+
+    The files ship with the package and never change at runtime, so the
+    five read syscalls per report are paid only on the first call.
+    read_bytes + decode skips Python-level newline translation and
+    is_file() avoids a second stat; a missing or unreadable asset embeds
+    as an empty string, matching the old behavior.
+    """
+    # One scandir per asset subdirectory replaces a stat-per-file existence
+    # probe; the DirEntry carries the file-type info for free
+    entries = {}
+    for subdir in ("css", "js"):
+        try:
+            with os.scandir(_SCRIPTS_DIR / subdir) as it:
+                for entry in it:
+                    entries[f"{subdir}/{entry.name}"] = entry
+        except OSError:
+            continue
+
+    assets = {}
+    for template_var, rel_path in _EMBEDDED_ASSETS:
+        entry = entries.get(rel_path)
+        try:
+            if entry is not None and entry.is_file():
+                with open(entry.path, "rb") as f:
+                    content = _minify_asset(rel_path, f.read().decode("utf-8"))
+            else:
+                content = ""
+        except Exception:
+            content = ""
+        assets[template_var] = content
+    return assets
+
+
+@functools.lru_cache(maxsize=4)
+def _ensure_report_dir(report_dir_str):
+    """Create the report directory once per distinct path per process."""
+    report_dir = Path(report_dir_str)
+    report_dir.mkdir(parents=True, exist_ok=True)
+    return report_dir
+
+
 def get_report_path():
     """
     Determine and create the report path from environment configuration.
@@ -316,9 +667,7 @@ def get_report_path():
     Returns:
         Path object for the HTML report file location
     """
-    report_path = get_env("REPORT_PATH", "reports")
-    report_dir = Path(report_path)
-    report_dir.mkdir(parents=True, exist_ok=True)
+    report_dir = _ensure_report_dir(get_env("REPORT_PATH", "reports"))
     return report_dir / "test_report.html"
 
 
@@ -335,6 +684,23 @@ def generate_report(report_rows, report_summary, start_time):
         Path to the generated HTML report
     """
 
+    # Nothing ran (collect-only, early abort): skip asset loading and the
+    # render entirely unless a report is explicitly forced
+    if (
+        not report_rows
+        and not (report_summary or {}).get("total", 0)
+        and get_env("ROBO_FORCE_REPORT", "0") != "1"
+    ):
+        print("\nNo test results - skipping HTML report", flush=True)
+        return None
+
+    # Format row durations up front; calling a Python global from inside
+    # the template costs Jinja call dispatch per row, while a plain
+    # {{ row.duration_fmt }} lookup does not
+    _fmt = format_duration
+    for row in report_rows:
+        row["duration_fmt"] = _fmt(row.get("duration", 0))
+
     # Prepare template data with raw numeric durations
     report_title = get_env("REPORT_TITLE", "Test Execution Report")
     template_data = {
@@ -343,58 +709,9 @@ def generate_report(report_rows, report_summary, start_time):
         "report_rows": report_rows,
     }
 
-    # Load CSS and JS files for embedding
-    try:
-        scripts_dir = (
-            Path(__file__).parent.parent / "templates" / "html_report" / "scripts"
-        )
-
-        # Read CSS files
-        css_path = scripts_dir / "css" / "report.css"
-        css_content = css_path.read_text(encoding="utf-8") if css_path.exists() else ""
-
-        material_icons_path = scripts_dir / "css" / "material-icons.css"
-        material_icons_content = (
-            material_icons_path.read_text(encoding="utf-8")
-            if material_icons_path.exists()
-            else ""
-        )
-
-        robo_fonts_path = scripts_dir / "css" / "robo-fonts.css"
-        robo_fonts_content = (
-            robo_fonts_path.read_text(encoding="utf-8")
-            if robo_fonts_path.exists()
-            else ""
-        )
-
-        # Read Chart.js library
-        chart_js_path = scripts_dir / "js" / "chart.js"
-        chart_js_content = (
-            chart_js_path.read_text(encoding="utf-8") if chart_js_path.exists() else ""
-        )
-
-        # Read merged JS file
-        report_js_path = scripts_dir / "js" / "report.js"
-
-        report_js_content = (
-            report_js_path.read_text(encoding="utf-8")
-            if report_js_path.exists()
-            else ""
-        )
-
-        # Add to template data
-        template_data["embedded_css"] = css_content
-        template_data["embedded_material_icons"] = material_icons_content
-        template_data["embedded_robo_fonts"] = robo_fonts_content
-        template_data["embedded_chart_js"] = chart_js_content
-        template_data["embedded_report_js"] = report_js_content
-    except Exception as e:
-        # If reading fails, use empty strings
-        template_data["embedded_css"] = ""
-        template_data["embedded_material_icons"] = ""
-        template_data["embedded_robo_fonts"] = ""
-        template_data["embedded_chart_js"] = ""
-        template_data["embedded_report_js"] = ""
+    # Embed the CSS/JS assets (memoized; the files never change during a
+    # process lifetime)
+    template_data.update(_load_embedded_assets())
 
     # Load template using get_html_template() which checks source first
     template = get_html_template()
@@ -402,17 +719,31 @@ def generate_report(report_rows, report_summary, start_time):
     # Register custom Jinja2 filter for duration formatting
     template.globals["format_duration"] = format_duration
 
-    # Render and save report
+    # Render and save report. Streaming writes template chunks to disk as
+    # they are produced instead of materializing the whole document (which
+    # for large suites briefly holds the entire report in memory twice).
     try:
-        html_content = template.render(**template_data)
-
         report_path = get_report_path()
-
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
-
-        print(f"\nHTML report generated: {report_path.absolute()}", flush=True)
-        return str(report_path.absolute())
+        # resolve() hits the filesystem once; reuse the string for both the
+        # console message and the return value
+        abs_path_str = os.fspath(report_path.resolve())
+
+        stream = template.stream(**template_data)
+        # Batch small template fragments so the writer sees fewer, larger
+        # chunks instead of one call per expression
+        stream.enable_buffering(100)
+        stream.dump(str(report_path), encoding="utf-8")
+
+        # Optional compressed copy alongside the report (handy for CI
+        # artifact uploads of very large reports)
+        if get_env("ROBO_GZIP_REPORT") == "1":
+            with open(report_path, "rb") as src, gzip.open(
+                str(report_path) + ".gz", "wb"
+            ) as dst:
+                shutil.copyfileobj(src, dst)
+
+        print(f"\nHTML report generated: {abs_path_str}", flush=True)
+        return abs_path_str
     except Exception as e:
         print(f"\nError generating HTML report: {e}", flush=True)
         import traceback
@@ -421,14 +752,13 @@ def generate_report(report_rows, report_summary, start_time):
         return None
 
 
-@staticmethod
+@functools.lru_cache(maxsize=1)
 def get_version():
     try:
         # pyproject.toml lives at the repo root (two levels above package dir)
         toml_path = Path(__file__).parents[2] / "pyproject.toml"
-        with open(toml_path, "rb") as f:
-            data = tomllib.load(f)
-            # Poetry-managed projects store version under [tool.poetry]
-            return data.get("tool", {}).get("poetry", {}).get("version", "0.0.0")
+        data = tomllib.loads(toml_path.read_bytes().decode("utf-8"))
+        # Poetry-managed projects store version under [tool.poetry]
+        return data.get("tool", {}).get("poetry", {}).get("version", "0.0.0")
     except Exception:
         return "0.0.0"
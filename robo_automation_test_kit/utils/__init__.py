@@ -5,6 +5,7 @@ Utility functions for robo-reporter
 from .RoboHelper import (
     load_test_data,
     get_env,
+    invalidate_env_cache,
     extract_test_case_name_from_docstring,
     print_results_summary,
     flatten_results,
@@ -13,6 +14,7 @@ from .RoboHelper import (
 __all__ = [
     'load_test_data',
     'get_env',
+    'invalidate_env_cache',
     'extract_test_case_name_from_docstring',
     'print_results_summary',
     'flatten_results',
@@ -5,48 +5,91 @@ def get_report_data(start_time):
     import os
     from datetime import datetime
 
+    # Local import avoids the circular dependency with RoboHelper, which
+    # imports get_html_template from this module at load time
+    from robo_automation_test_kit.utils.RoboHelper import get_env
+
     project_root = os.path.abspath(
         os.path.join(os.path.dirname(__file__), "..", "..", "..")
     )
     report_dir = os.path.join(project_root, "reports")
     return {
-        "project_name": os.getenv("PROJECT_NAME", ""),
-        "env_name": os.getenv("APP_ENV", ""),
-        "test_framework": os.getenv("TEST_FRAMEWORK", "Robo Automation Framework"),
+        "project_name": get_env("PROJECT_NAME"),
+        "env_name": get_env("APP_ENV"),
+        "test_framework": get_env("TEST_FRAMEWORK", "Robo Automation Framework"),
         "start_time": start_time,
         "end_time": datetime.now(),
         "report_dir": report_dir,
     }
 
 
+import functools
 import os
 
+# Package template location, computed once at import; get_html_template
+# only rebuilds paths for the per-project override check
+_PACKAGE_TEMPLATE_DIR = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")),
+    "templates",
+    "html_report",
+)
+
+
+def _bytecode_cache():
+    """
+    Persist compiled templates across processes so only the very first run
+    on a machine pays Jinja's lex/parse/codegen cost; later pytest
+    invocations load the marshalled code objects. Returns None (no disk
+    cache, in-memory compile only) if the cache dir cannot be created.
+    """
+    import tempfile
+
+    from jinja2 import FileSystemBytecodeCache
+
+    cache_dir = os.path.join(tempfile.gettempdir(), "robo_jinja_cache")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(directory=cache_dir, pattern="__jinja_%s.cache")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_template(template_dir, name):
+    """
+    Build the Jinja2 Environment and compile the named template, once per
+    template directory. The Environment is the expensive part (parser +
+    compiler setup), so it is created only on cache misses; auto_reload is
+    off because templates never change within a session.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        auto_reload=False,
+        cache_size=400,
+        bytecode_cache=_bytecode_cache(),
+    )
+    return env.get_template(name)
+
 
 def get_html_template():
     """
     Returns the Jinja2 template object for the HTML report.
-    Checks for source template in project working directory first, then falls back to package template.
+    Checks for source template in project working directory first, then falls
+    back to package template. The compiled template is cached per directory.
     """
-    import os
-    from jinja2 import Environment, FileSystemLoader
     from pathlib import Path
 
     # Check for source template in current working directory only
     source_template_dir = Path.cwd() / "templates" / "html_report"
     source_template_file = source_template_dir / "html_template.html"
-    
-    if source_template_file.exists():
-        # print(f"Loading source template from: {source_template_dir}", flush=True)
-        env = Environment(loader=FileSystemLoader(str(source_template_dir)))
-        return env.get_template("html_template.html")
-    
+
+    if source_template_file.is_file():
+        return _load_template(str(source_template_dir), "html_template.html")
+
     # Fall back to package template inside robo_automation_test_kit directory
-    package_root = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "..")
-    )
-    package_template_dir = os.path.join(package_root, "templates", "html_report")
-    env = Environment(loader=FileSystemLoader(package_template_dir))
-    return env.get_template("html_template.html")
+    return _load_template(_PACKAGE_TEMPLATE_DIR, "html_template.html")
 
 
 
@@ -66,14 +109,22 @@ def get_report_summary(all_results, report_data):
     else:
         duration_str = "-"
 
-    # Count test statuses for summary chart, treating 'ERROR' as 'FAILED'
-    status_counts = {"PASSED": 0, "FAILED": 0, "SKIPPED": 0, "RERUN": 0}
-    for result in all_results:
-        status = str(result.get("test_status", "")).upper()
-        if status == "ERROR":
-            status = "FAILED"
-        if status in status_counts:
-            status_counts[status] += 1
+    # One clock read for both formatted stamps
+    now = datetime.now()
+
+    # Count test statuses for summary chart in one pass, treating 'ERROR'
+    # as 'FAILED'
+    from collections import Counter
+
+    counts = Counter(
+        str(result.get("test_status", "")).upper() for result in all_results
+    )
+    status_counts = {
+        "PASSED": counts["PASSED"],
+        "FAILED": counts["FAILED"] + counts["ERROR"],
+        "SKIPPED": counts["SKIPPED"],
+        "RERUN": counts["RERUN"],
+    }
     return {
         "env_name": report_data.get("env_name", ""),
         "project_name": report_data.get("project_name", ""),
@@ -84,8 +135,8 @@ def get_report_summary(all_results, report_data):
         "failed": status_counts["FAILED"],
         "skipped": status_counts["SKIPPED"],
         "rerun": status_counts["RERUN"],
-        "generated_date": datetime.now().strftime('%m-%d-%Y'),
-        "generated_time": datetime.now().strftime('%I:%M:%S %p'),
+        "generated_date": now.strftime('%m-%d-%Y'),
+        "generated_time": now.strftime('%I:%M:%S %p'),
     }
 
 
@@ -127,8 +178,9 @@ def generate_html_report(all_results, output_path, report_data=None):
     # Defensive: allow report_data to be None
     if report_data is None:
         report_data = {}
-    report_title = os.getenv("REPORT_TITLE", "Test Report")
-    from datetime import datetime
+    from robo_automation_test_kit.utils.RoboHelper import get_env
+
+    report_title = get_env("REPORT_TITLE", "Test Report")
     summary = get_report_summary(all_results, report_data)
 
     template = get_html_template()
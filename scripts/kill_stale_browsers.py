@@ -17,11 +17,55 @@ def _print_header() -> None:
     print("=========================================\n")
 
 
+# Every spelling of the target process names we expect from the OS; a set
+# membership test rejects the vast majority of processes without the
+# lower()/suffix-strip allocations in _normalize_name
+_TARGET_NAMES = frozenset(
+    {
+        "chrome",
+        "chromedriver",
+        "chrome.exe",
+        "chromedriver.exe",
+        "Chrome",
+        "ChromeDriver",
+        "Chrome.exe",
+        "ChromeDriver.exe",
+    }
+)
+
+
 def _normalize_name(name: str) -> str:
-    n = name.lower()
-    if n.endswith(".exe"):
-        n = n[:-4]
-    return n
+    return name.lower().removesuffix(".exe")
+
+
+def _scan_proc_linux() -> tuple[list[int], list[int]] | None:
+    """
+    Linux fast path: find chrome/chromedriver PIDs straight from /proc.
+
+    psutil.process_iter stats and reads several /proc/<pid> files for every
+    process on the system; reading only /proc/<pid>/comm (one small file per
+    PID) filters out non-matches with a fraction of the syscalls. Returns
+    None when /proc is not usable so the caller can fall back to psutil.
+    """
+    chrome_pids: list[int] = []
+    driver_pids: list[int] = []
+    try:
+        entries = os.listdir("/proc")
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/comm", "rb") as f:
+                comm = f.read().rstrip().decode("ascii", "replace")
+        except OSError:
+            continue  # process exited or is inaccessible
+        if comm == "chrome":
+            chrome_pids.append(int(entry))
+        elif comm == "chromedriver":
+            driver_pids.append(int(entry))
+    return chrome_pids, driver_pids
 
 
 def _kill_with_psutil() -> tuple[int, int]:
@@ -33,24 +77,44 @@ def _kill_with_psutil() -> tuple[int, int]:
     chrome_killed = 0
     driver_killed = 0
 
-    targets = {"chrome", "chromedriver"}
-
-    # Collect PIDs by target name
-    chrome_pids: list[int] = []
-    driver_pids: list[int] = []
+    # Collect PIDs by target name; on Linux scan /proc directly, elsewhere
+    # (or if /proc is unavailable) fall back to a full process_iter pass
+    scanned = _scan_proc_linux() if sys.platform == "linux" else None
+    if scanned is not None:
+        chrome_pids, driver_pids = scanned
+    else:
+        chrome_pids = []
+        driver_pids = []
+        for p in psutil.process_iter(attrs=["pid", "name"]):
+            try:
+                name = p.info.get("name") or ""
+                if name not in _TARGET_NAMES:
+                    continue
+                n = _normalize_name(name)
+                if n == "chrome":
+                    chrome_pids.append(int(p.info["pid"]))
+                elif n == "chromedriver":
+                    driver_pids.append(int(p.info["pid"]))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+    # Terminate then kill remaining; signals to different processes are
+    # independent, so fan them out instead of issuing them one at a time
+    def _signal_all(procs: list, method_name: str) -> int:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def send(proc) -> int:
+            try:
+                getattr(proc, method_name)()
+                return 1
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                return 0
 
-    for p in psutil.process_iter(attrs=["pid", "name"]):
-        try:
-            name = p.info.get("name") or ""
-            n = _normalize_name(name)
-            if n == "chrome":
-                chrome_pids.append(int(p.info["pid"]))
-            elif n == "chromedriver":
-                driver_pids.append(int(p.info["pid"]))
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
+        if len(procs) <= 1:
+            return sum(send(proc) for proc in procs)
+        with ThreadPoolExecutor(max_workers=min(32, len(procs))) as pool:
+            return sum(pool.map(send, procs))
 
-    # Terminate then kill remaining
     def terminate_group(pids: Iterable[int]) -> int:
         count = 0
         processes = []
@@ -59,19 +123,10 @@ def _kill_with_psutil() -> tuple[int, int]:
                 processes.append(psutil.Process(pid))
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
-        for proc in processes:
-            try:
-                proc.terminate()
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        _signal_all(processes, "terminate")
         gone, alive = psutil.wait_procs(processes, timeout=2)
         count += len(gone)
-        for proc in alive:
-            try:
-                proc.kill()
-                count += 1
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        count += _signal_all(alive, "kill")
         return count
 
     print("Searching for Chrome processes...", flush=True)
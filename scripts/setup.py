@@ -56,31 +56,34 @@ def main():
 
     print(f"\nUsing virtual environment python: {venv_python}")
 
-    # Upgrade pip
-    print("\nUpgrading pip...")
+    # Upgrade pip and install requirements in a single pip invocation: one
+    # interpreter start and one resolver run instead of two. The extra
+    # flags skip pip's PyPI version probe and interactive prompts, and
+    # prefer wheels over source builds.
+    pip_args = [
+        str(venv_python),
+        "-m",
+        "pip",
+        "install",
+        "--upgrade",
+        "--disable-pip-version-check",
+        "--no-input",
+        "--prefer-binary",
+        "pip",
+    ]
+    if requirements_file.exists():
+        print("\nUpgrading pip and installing packages from requirements.txt...")
+        pip_args += ["-r", "requirements.txt"]
+    else:
+        print(f"\nWarning: requirements.txt not found at {requirements_file}")
+        print("Upgrading pip...")
     try:
-        subprocess.check_call(
-            [str(venv_python), "-m", "pip", "install", "--upgrade", "pip"]
-        )
+        subprocess.check_call(pip_args)
     except subprocess.CalledProcessError:
-        print("Error: Failed to upgrade pip")
+        print("Error: Failed to install packages")
         input("Press Enter to exit")
         sys.exit(1)
 
-    # Install requirements
-    if requirements_file.exists():
-        print("\nInstalling packages from requirements.txt...")
-        try:
-            subprocess.check_call(
-                [str(venv_python), "-m", "pip", "install", "-r", "requirements.txt"]
-            )
-        except subprocess.CalledProcessError:
-            print("Error: Failed to install packages")
-            input("Press Enter to exit")
-            sys.exit(1)
-    else:
-        print(f"\nWarning: requirements.txt not found at {requirements_file}")
-
     print("\n" + "=" * 63)
     print("Setup Complete!")
     print("=" * 63 + "\n")
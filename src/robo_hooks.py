@@ -0,0 +1,50 @@
+"""
+Shared robo-reporter hook implementations.
+
+Keeping robo_modify_report_row in one module lets every conftest.py that
+needs it do a single import instead of carrying its own copy. The
+@pytest.hookimpl marker makes pytest register the function as a hook
+implementation when the importing conftest module is loaded.
+"""
+
+import sys
+
+import pytest
+
+# (report_row key, CSV column) pairs copied into every report row. The
+# column names contain spaces/hyphens so CPython does not intern them
+# automatically; sys.intern lets dict lookups on these keys short-circuit
+# on identity instead of falling back to full string comparison.
+_REPORT_KEY_MAP = tuple(
+    (sys.intern(dest), sys.intern(src))
+    for dest, src in (
+        ("test_case_name", "Test Case Name"),
+        ("Phase", "Phase"),
+        ("Request Category", "Request Category"),
+        ("Request Sub-Category", "Request Sub-Category"),
+        ("Center", "Center"),
+    )
+)
+
+
+@pytest.hookimpl
+def robo_modify_report_row(report_row, test_data):
+    """
+    Enrich a test report row with custom columns from the CSV test data.
+
+    Args:
+        report_row: Dictionary with default test report data
+        test_data: Dictionary with parametrized test data from CSV
+
+    Returns:
+        The report_row dict extended with the _REPORT_KEY_MAP columns.
+    """
+    # Project the fixed CSV columns into the report row in one data-driven
+    # pass; the local bound method avoids re-resolving test_data.get per key
+    get = test_data.get
+    for dest_key, src_key in _REPORT_KEY_MAP:
+        report_row[dest_key] = get(src_key, "")
+    # Add more custom attributes as needed by extending _REPORT_KEY_MAP, e.g.
+    # ("Jira ID", "Jira ID"), ("sprint", "Sprint"),
+
+    return report_row